@@ -5,7 +5,8 @@ from langgraph.graph import StateGraph, END
 from app.utils.config import Config
 from app.schemas.state import InterviewState
 from app.schemas.actions import InterviewDecision
-from app.core.prompts import INTERVIEWER_SYSTEM_PROMPT, EVALUATOR_SYSTEM_PROMPT
+from app.core.prompts import INTERVIEWER_SYSTEM_PROMPT, EVALUATOR_SYSTEM_PROMPT, DEFAULT_QUESTIONS_PLAN
+from app.services.question_plans import get_questions_plan, session_seed
 
 from google.oauth2 import service_account
 credentials = service_account.Credentials.from_service_account_file(
@@ -44,11 +45,21 @@ def run_interviewer_agent(state: InterviewState):
 
     next_step_num = current_step + 1
 
+    try:
+        questions_plan = get_questions_plan(role, context, session_seed(messages))
+    except Exception as e:
+        print(f"Question Plan Error: {e}")
+        questions_plan = None
+
+    if questions_plan is None:
+        questions_plan = DEFAULT_QUESTIONS_PLAN.format(role=role, context=context)
+
     system_msg = INTERVIEWER_SYSTEM_PROMPT.format(
         role=role, 
         context=context, 
         current_q_num=current_step + 1,
-        next_q_num=next_step_num + 1
+        next_q_num=next_step_num + 1,
+        questions_plan=questions_plan
     )
     
     prompt = [SystemMessage(content=system_msg)] + messages
@@ -26,13 +26,34 @@ LOGIC RULES:
    - DO NOT ask any more questions.
 
 QUESTIONS PLAN (For reference):
-- Q1: Intro & Experience (Ask about their background relevant to {role}).
-- Q2 & Q3: Domain Knowledge / Hard Skills (Test core skills: Coding for devs, Design for creatives, Strategy for business, etc.).
-- Q4: Behavioral / Scenario (Use a realistic workplace situation based on {context}).
+{questions_plan}
 
 Maintain a professional yet encouraging tone.
 """
 
+DEFAULT_QUESTIONS_PLAN = """- Q1: Intro & Experience (Ask about their background relevant to {role}).
+- Q2 & Q3: Domain Knowledge / Hard Skills (Test core skills: Coding for devs, Design for creatives, Strategy for business, etc.).
+- Q4: Behavioral / Scenario (Use a realistic workplace situation based on {context})."""
+
+CACHED_QUESTIONS_PLAN = """- Q1: Intro & Experience (Ask about their background relevant to {role}).
+- Q2: {q2}
+- Q3: {q3}
+- Q4: {q4}
+Ask these planned questions as written (you may lightly adapt the wording to the conversation)."""
+
+QUESTION_PLAN_SYSTEM_PROMPT = """
+You are a Senior Hiring Manager preparing a reusable question bank for the '{role}' position in the '{context}' industry.
+
+Write:
+- {domain_count} Domain Knowledge / Hard Skills questions (Coding for devs, Design for creatives, Strategy for business, etc.).
+- {behavioral_count} Behavioral / Scenario questions using realistic workplace situations based on {context}.
+
+RULES:
+- Each question must be self-contained, a single spoken sentence or two, and answerable in about two minutes.
+- Questions must be distinct from each other and cover different skills.
+- Do not number the questions or add any commentary.
+"""
+
 EVALUATOR_SYSTEM_PROMPT = """
 You are an expert Talent Acquisition Specialist and Senior Hiring Manager.
 Your task is to analyze the completed interview transcript and provide a structured assessment.
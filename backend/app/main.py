@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from langchain_core.messages import HumanMessage, AIMessage
-from app.services.audio import transcribe_audio, text_to_speech
+from app.services.audio import transcribe_audio, text_to_speech, tts_mime_type
 import shutil
 import json
 import os
@@ -46,6 +46,7 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     response_text: str
     response_audio: str | None = None
+    response_audio_mime: str | None = None
     interview_step: int
     is_finished: bool
     feedback: Optional[str] = None
@@ -109,6 +110,7 @@ async def chat_endpoint(request: ChatRequest):
         return ChatResponse(
             response_text=clean_response_text, 
             response_audio=audio_base64,      
+            response_audio_mime=tts_mime_type() if audio_base64 else None,
             interview_step=output.get("interview_step", 0),
             is_finished=is_finished,
             feedback=feedback_text
@@ -141,6 +143,7 @@ async def chat_audio_endpoint(
                 "user_input": "",
                 "response_text": "I couldn't hear you clearly. Could you please repeat?",
                 "response_audio": "", 
+                "response_audio_mime": None,
                 "interview_step": interview_step,
                 "is_finished": False,
                 "feedback": None
@@ -183,13 +186,14 @@ async def chat_audio_endpoint(
         feedback = result.get("feedback", None)
         
         audio_base64 = ""
-        if not clean_audio_text:
+        if clean_audio_text:
             audio_base64 = await text_to_speech(clean_audio_text)
         
         return {
             "user_input": user_text,
             "response_text": clean_audio_text,
             "response_audio": audio_base64,
+            "response_audio_mime": tts_mime_type() if audio_base64 else None,
             "interview_step": new_step,
             "is_finished": feedback is not None,
             "feedback": feedback
@@ -224,11 +228,6 @@ async def websocket_endpoint(websocket: WebSocket):
                     print("Base64 decode error")
                     continue
 
-                file_size = len(audio_bytes)
-                if file_size < 3000: 
-                    print(f"Ignored small audio/noise packet ({file_size} bytes)")
-                    continue 
-                
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as temp_audio:
                     temp_audio.write(audio_bytes)
                     temp_audio_path = temp_audio.name
@@ -267,6 +266,7 @@ async def websocket_endpoint(websocket: WebSocket):
                         "type": "audio",
                         "text": clean_text,
                         "audio": audio_base64,
+                        "audio_mime": tts_mime_type() if audio_base64 else None,
                         "interview_step": output.get("interview_step", 1),
                         "is_finished": "INTERVIEW_FINISHED" in ai_text or feedback_text is not None,
                         "feedback": feedback_text 
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class QuestionPlan(BaseModel):
+    """
+    Model to structure a precomputed question bank for a role and industry context.
+    """
+    domain_questions: List[str] = Field(
+        description="Domain Knowledge / Hard Skills questions. Two of them are asked as Q2 and Q3."
+    )
+    behavioral_questions: List[str] = Field(
+        description="Behavioral / Scenario questions. One of them is asked as Q4."
+    )
@@ -1,49 +1,181 @@
 import os
 import base64
-from openai import AsyncOpenAI  
+import shutil
+import asyncio
+from typing import Optional, Tuple
+from openai import AsyncOpenAI
 from app.utils.config import Config
 
 
 client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
+FFMPEG_BIN = "ffmpeg"
+FFMPEG_AVAILABLE = shutil.which(FFMPEG_BIN) is not None
+
+if not FFMPEG_AVAILABLE:
+    print("ffmpeg not found: STT preprocessing and TTS re-encoding are disabled")
+
+# OpenAI returns "pcm" as raw 24kHz, 16-bit signed little-endian, mono samples.
+TTS_PCM_SAMPLE_RATE = 24000
+
+TTS_FORMATS = {
+    # format: (mime type, ffmpeg codec, ffmpeg container)
+    "mp3": ("audio/mpeg", "libmp3lame", "mp3"),
+    "opus": ("audio/ogg", "libopus", "ogg"),
+    "aac": ("audio/aac", "aac", "adts"),
+}
+
+
+async def _run_ffmpeg(args: list, input_bytes: Optional[bytes] = None) -> bytes:
+    """
+    It runs ffmpeg with the given arguments and returns whatever it writes to stdout.
+    """
+    process = await asyncio.create_subprocess_exec(
+        FFMPEG_BIN, "-hide_banner", "-loglevel", "error", *args,
+        stdin=asyncio.subprocess.PIPE if input_bytes is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate(input=input_bytes)
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode("utf-8", errors="ignore").strip() or "ffmpeg failed")
+    return stdout
+
+
+async def prepare_stt_audio(file_path: str) -> Optional[Tuple[str, bytes]]:
+    """
+    It trims silence, downmixes to mono and resamples the recording before it is sent to Whisper.
+    Returns None when no speech is left after trimming (noise gate).
+    """
+    if Config.STT_PREPROCESS and FFMPEG_AVAILABLE:
+        threshold = f"{Config.STT_SILENCE_THRESHOLD_DB}dB"
+        try:
+            pcm = await _run_ffmpeg([
+                "-i", file_path,
+                "-af", (
+                    f"silenceremove=start_periods=1:start_threshold={threshold}"
+                    f":stop_periods=-1:stop_duration=1:stop_threshold={threshold}"
+                ),
+                "-ac", "1",
+                "-ar", str(Config.STT_SAMPLE_RATE),
+                "-f", "s16le", "pipe:1",
+            ])
+
+            speech_seconds = len(pcm) / (2 * Config.STT_SAMPLE_RATE)
+            if speech_seconds < Config.STT_MIN_SPEECH_SECONDS:
+                print(f"Ignored silent/noise audio ({speech_seconds:.2f}s of speech)")
+                return None
+
+            encoded = await _run_ffmpeg([
+                "-f", "s16le",
+                "-ar", str(Config.STT_SAMPLE_RATE),
+                "-ac", "1",
+                "-i", "pipe:0",
+                "-c:a", "libopus",
+                "-b:a", Config.STT_BITRATE,
+                "-application", "voip",
+                "-f", "ogg", "pipe:1",
+            ], input_bytes=pcm)
+            return "speech.ogg", encoded
+
+        except Exception as e:
+            print(f"Audio Preprocess Error: {e}")
+
+    with open(file_path, "rb") as audio_file:
+        raw_audio = audio_file.read()
+
+    if len(raw_audio) < Config.STT_MIN_RAW_BYTES:
+        print(f"Ignored small audio/noise packet ({len(raw_audio)} bytes)")
+        return None
+    return os.path.basename(file_path), raw_audio
+
+
 async def transcribe_audio(file_path: str) -> str:
     """
     It converts the audio file to text asynchronously.
     """
     try:
-        with open(file_path, "rb") as audio_file:
-            transcription = await client.audio.transcriptions.create(
-                model="whisper-1", 
-                file=audio_file,
-                language="en",
-                temperature=0.0, 
-                prompt=(
-                    "Software Engineering Interview context. "
-                    "Technical terms: Python, SQL, React, AWS, Docker, Kubernetes, "
-                    "System Design, Scalability, REST API, Algorithms, Data Structures."
-                    "The candidate is speaking clearly."
-                )
+        audio = await prepare_stt_audio(file_path)
+        if audio is None:
+            return ""
+
+        transcription = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio,
+            language="en",
+            temperature=0.0,
+            prompt=(
+                "Software Engineering Interview context. "
+                "Technical terms: Python, SQL, React, AWS, Docker, Kubernetes, "
+                "System Design, Scalability, REST API, Algorithms, Data Structures."
+                "The candidate is speaking clearly."
             )
+        )
         return transcription.text
     except Exception as e:
         print(f"Whisper Async Error: {e}")
         return ""
 
+
+def tts_mime_type(audio_format: Optional[str] = None) -> str:
+    """
+    It returns the MIME type the browser should use to play the TTS output.
+    """
+    audio_format = audio_format or Config.TTS_FORMAT
+    return TTS_FORMATS.get(audio_format, TTS_FORMATS["mp3"])[0]
+
+
+async def synthesize_speech(
+    text: str,
+    audio_format: Optional[str] = None,
+    bitrate: Optional[str] = None,
+    reencode: bool = True,
+) -> bytes:
+    """
+    It generates speech in the requested format, re-encoding at a lower bitrate when one is set.
+    With reencode=False, or without ffmpeg, the bitrate is ignored and the native format is requested.
+    """
+    audio_format = audio_format or Config.TTS_FORMAT
+    bitrate = (bitrate or Config.TTS_BITRATE) if reencode else None
+    if audio_format not in TTS_FORMATS:
+        raise ValueError(f"Unsupported TTS format: {audio_format}")
+
+    if bitrate and FFMPEG_AVAILABLE:
+        response = await client.audio.speech.create(
+            model=Config.TTS_MODEL,
+            voice=Config.TTS_VOICE,
+            input=text,
+            response_format="pcm"
+        )
+        _, codec, container = TTS_FORMATS[audio_format]
+        return await _run_ffmpeg([
+            "-f", "s16le",
+            "-ar", str(TTS_PCM_SAMPLE_RATE),
+            "-ac", "1",
+            "-i", "pipe:0",
+            "-c:a", codec,
+            "-b:a", bitrate,
+            "-f", container, "pipe:1",
+        ], input_bytes=response.content)
+
+    response = await client.audio.speech.create(
+        model=Config.TTS_MODEL,
+        voice=Config.TTS_VOICE,
+        input=text,
+        response_format=audio_format
+    )
+    return response.content
+
+
 async def text_to_speech(text: str) -> str:
     """
     It converts text to speech asynchronously.
     """
     try:
-        response = await client.audio.speech.create(
-            model="tts-1",
-            voice="alloy",
-            input=text
-        )
+        audio_content = await synthesize_speech(text)
 
-        audio_content = response.content 
-        
         audio_base64 = base64.b64encode(audio_content).decode("utf-8")
         return audio_base64
     except Exception as e:
         print(f"TTS Async Error: {e}")
-        return ""
\ No newline at end of file
+        return ""
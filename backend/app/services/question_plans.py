@@ -0,0 +1,256 @@
+import os
+import re
+import json
+import time
+import random
+import difflib
+import tempfile
+from typing import Dict, Optional, Tuple
+
+from app.utils.config import Config
+from app.schemas.question_plan import QuestionPlan
+from app.core.prompts import QUESTION_PLAN_SYSTEM_PROMPT, CACHED_QUESTIONS_PLAN
+from langchain_core.messages import SystemMessage, HumanMessage
+
+
+PHRASE_SYNONYMS = {
+    "front end": "frontend",
+    "back end": "backend",
+    "full stack": "fullstack",
+    "machine learning": "ml",
+    "artificial intelligence": "ai",
+    "user experience": "ux",
+    "user interface": "ui",
+    "quality assurance": "qa",
+    "site reliability": "sre",
+}
+
+TOKEN_SYNONYMS = {
+    "engineer": "developer",
+    "dev": "developer",
+    "programmer": "developer",
+    "swe": "software developer",
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "mgr": "manager",
+    "pm": "product manager",
+}
+
+# Only applied to the industry context: in a role, "tech" is part of titles like "Tech Lead".
+CONTEXT_SYNONYMS = {**TOKEN_SYNONYMS, "tech": "technology"}
+
+STOPWORDS = {"a", "an", "the", "of", "for", "and", "in", "at", "position", "role"}
+
+# Seniority does not change the question bank, so "Sr. Backend Engineer" shares the "backend developer" plan.
+SENIORITY = {"senior", "junior", "lead", "staff", "principal"}
+
+# Words that do not identify a role on their own, so seniority is kept when nothing more specific is left.
+GENERIC_ROLE_TOKENS = {"developer", "manager", "tech"}
+
+
+def normalize_text(text: str, synonyms: Dict[str, str] = TOKEN_SYNONYMS) -> str:
+    """
+    It lowercases the text, strips punctuation and maps common synonyms to a canonical form.
+    """
+    text = re.sub(r"[^a-z0-9+#]+", " ", (text or "").lower()).strip()
+    for phrase, replacement in PHRASE_SYNONYMS.items():
+        text = re.sub(rf"\b{phrase}\b", replacement, text)
+
+    tokens = []
+    for token in text.split():
+        if token in STOPWORDS:
+            continue
+        if token.endswith("s") and token[:-1] in synonyms:
+            token = token[:-1]
+        tokens.extend(synonyms.get(token, token).split())
+    return " ".join(tokens)
+
+
+def normalize_role(role: str) -> str:
+    """
+    It normalizes a job role and drops seniority, unless that would leave only a generic word
+    ("Staff Engineer" stays "staff developer", "Tech Lead" stays "tech lead").
+    """
+    tokens = normalize_text(role).split()
+    specific = [t for t in tokens if t not in SENIORITY]
+    if any(t not in GENERIC_ROLE_TOKENS for t in specific):
+        return " ".join(specific)
+    return " ".join(tokens)
+
+
+def make_key(role: str, context: str) -> str:
+    return f"{normalize_role(role)}|{normalize_text(context, CONTEXT_SYNONYMS)}"
+
+
+def roles_match(role: str, candidate: str) -> bool:
+    """
+    Fuzzy match of two normalized roles, token by token, so typos and plurals match
+    but different roles sharing a suffix ("frontend developer" / "backend developer") do not.
+    Short tokens such as "ai", "ml" or "qa" must match exactly.
+    """
+    tokens, candidate_tokens = role.split(), candidate.split()
+    if len(tokens) != len(candidate_tokens):
+        return False
+
+    for token, candidate_token in zip(sorted(tokens), sorted(candidate_tokens)):
+        if token == candidate_token:
+            continue
+        if min(len(token), len(candidate_token)) <= 3:
+            return False
+        ratio = difflib.SequenceMatcher(None, token, candidate_token).ratio()
+        if ratio < Config.QUESTION_PLAN_MATCH_CUTOFF:
+            return False
+    return True
+
+
+class QuestionPlanCache:
+    """
+    Normalized role/context index of precomputed question plans, persisted as JSON.
+    """
+
+    def __init__(self, path: str, ttl_hours: float):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self._entries: Dict[str, dict] = {}
+        self._loaded_mtime: Optional[float] = None
+
+    @property
+    def entries(self) -> Dict[str, dict]:
+        """
+        The warm-up job runs in a separate process, so the file is reloaded whenever it changes on disk.
+        A failed load keeps the previous entries and is retried on the next access.
+        """
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return self._entries
+
+        if mtime != self._loaded_mtime:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+                if not isinstance(entries, dict) or not all(
+                    isinstance(k, str) and isinstance(v, dict) for k, v in entries.items()
+                ):
+                    raise ValueError("expected an object of role/context keys to plan entries")
+                self._entries = entries
+                self._loaded_mtime = mtime
+            except Exception as e:
+                print(f"Question Plan Cache Load Error: {e}")
+        return self._entries
+
+    def _fresh_plan(self, entry: Optional[dict]) -> Optional[QuestionPlan]:
+        """
+        It returns the entry's plan if it is fresh and well-formed, otherwise None.
+        """
+        if entry is None:
+            return None
+        try:
+            if time.time() - float(entry.get("created_at", 0)) >= self.ttl_seconds:
+                return None
+            return QuestionPlan(**entry["plan"])
+        except Exception:
+            return None
+
+    def lookup(self, role: str, context: str) -> Optional[Tuple[str, QuestionPlan]]:
+        """
+        It finds the fresh plan for a role/context, falling back to a fuzzy role match within the same context.
+        """
+        key = make_key(role, context)
+        entries = self.entries
+
+        plan = self._fresh_plan(entries.get(key))
+        if plan is not None:
+            return key, plan
+
+        role_key, context_key = key.split("|", 1)
+        for candidate, candidate_entry in entries.items():
+            if candidate == key or "|" not in candidate:
+                continue
+            candidate_role, candidate_context = candidate.split("|", 1)
+            if candidate_context != context_key or not roles_match(role_key, candidate_role):
+                continue
+            plan = self._fresh_plan(candidate_entry)
+            if plan is not None:
+                return candidate, plan
+        return None
+
+    def store(self, role: str, context: str, plan: QuestionPlan):
+        self.entries[make_key(role, context)] = {
+            "role": role,
+            "context": context,
+            "created_at": time.time(),
+            "plan": plan.model_dump(),
+        }
+
+    def needs_refresh(self, role: str, context: str) -> bool:
+        return self._fresh_plan(self.entries.get(make_key(role, context))) is None
+
+    def save(self):
+        """
+        It writes the cache atomically so a running server never reads a half-written file.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._loaded_mtime = os.path.getmtime(self.path)
+
+
+question_plan_cache = QuestionPlanCache(Config.QUESTION_PLAN_CACHE_PATH, Config.QUESTION_PLAN_TTL_HOURS)
+
+
+def generate_question_plan(llm, role: str, context: str) -> QuestionPlan:
+    """
+    It asks the LLM for a reusable question bank for the given role and context.
+    """
+    prompt = [
+        SystemMessage(content=QUESTION_PLAN_SYSTEM_PROMPT.format(
+            role=role,
+            context=context,
+            domain_count=Config.QUESTION_PLAN_DOMAIN_COUNT,
+            behavioral_count=Config.QUESTION_PLAN_BEHAVIORAL_COUNT,
+        )),
+        HumanMessage(content="Please write the question bank."),
+    ]
+    structured_llm = llm.with_structured_output(QuestionPlan)
+    return structured_llm.invoke(prompt)
+
+
+def session_seed(messages) -> str:
+    """
+    The candidate's first answer is resent with every turn, so it keeps question rotation stable within a session.
+    """
+    for msg in messages:
+        if isinstance(msg, HumanMessage):
+            content = msg.content
+            if isinstance(content, list):
+                content = "".join([item.get("text", "") for item in content if isinstance(item, dict)])
+            return str(content)
+    return ""
+
+
+def get_questions_plan(role: str, context: str, seed: str) -> Optional[str]:
+    """
+    It renders a cached plan for the interviewer prompt, rotating questions by session seed.
+    Returns None when no fresh plan is cached.
+    """
+    cached = question_plan_cache.lookup(role, context)
+    if cached is None:
+        return None
+
+    key, plan = cached
+    if len(plan.domain_questions) < 2 or not plan.behavioral_questions:
+        return None
+
+    rng = random.Random(f"{key}|{seed}")
+    q2, q3 = rng.sample(plan.domain_questions, 2)
+    q4 = rng.choice(plan.behavioral_questions)
+    return CACHED_QUESTIONS_PLAN.format(role=role, q2=q2, q3=q3, q4=q4)
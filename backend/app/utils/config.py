@@ -14,6 +14,29 @@ class Config:
     
     TEMPERATURE = 0.7
 
+    # Inbound audio (candidate -> Whisper)
+    STT_PREPROCESS = os.getenv("STT_PREPROCESS", "true").lower() == "true"
+    STT_SAMPLE_RATE = 16000
+    STT_SILENCE_THRESHOLD_DB = int(os.getenv("STT_SILENCE_THRESHOLD_DB", "-45"))
+    STT_MIN_SPEECH_SECONDS = float(os.getenv("STT_MIN_SPEECH_SECONDS", "0.4"))
+    STT_BITRATE = os.getenv("STT_BITRATE", "24k")
+    STT_MIN_RAW_BYTES = 3000
+
+    # Outbound audio (TTS -> browser). TTS_FORMAT: mp3 | opus | aac.
+    # Setting TTS_BITRATE (e.g. "24k") re-encodes the raw TTS output with ffmpeg.
+    TTS_MODEL = os.getenv("TTS_MODEL", "tts-1")
+    TTS_VOICE = os.getenv("TTS_VOICE", "alloy")
+    TTS_FORMAT = os.getenv("TTS_FORMAT", "mp3").lower()
+    TTS_SUPPORTED_FORMATS = ("mp3", "opus", "aac")
+    TTS_BITRATE = os.getenv("TTS_BITRATE")
+
+    # Precomputed per-role question plans (see warm_question_plans.py)
+    QUESTION_PLAN_CACHE_PATH = os.getenv("QUESTION_PLAN_CACHE_PATH", "question_plans.json")
+    QUESTION_PLAN_TTL_HOURS = float(os.getenv("QUESTION_PLAN_TTL_HOURS", "168"))
+    QUESTION_PLAN_MATCH_CUTOFF = 0.85
+    QUESTION_PLAN_DOMAIN_COUNT = 6
+    QUESTION_PLAN_BEHAVIORAL_COUNT = 3
+
     @staticmethod
     def validate():
         if not os.path.exists(Config.GOOGLE_CREDENTIALS_PATH):
@@ -22,4 +45,10 @@ class Config:
         if not Config.PROJECT_ID:
              raise ValueError("GOOGLE_CLOUD_PROJECT is missing in .env")
 
+        if Config.TTS_FORMAT not in Config.TTS_SUPPORTED_FORMATS:
+            raise ValueError(
+                f"TTS_FORMAT '{Config.TTS_FORMAT}' is not supported. "
+                f"Use one of: {', '.join(Config.TTS_SUPPORTED_FORMATS)}"
+            )
+
 Config.validate()
\ No newline at end of file
@@ -0,0 +1,140 @@
+import os
+import sys
+import math
+import time
+import wave
+import base64
+import asyncio
+import tempfile
+
+from app.services.audio import prepare_stt_audio, synthesize_speech, TTS_FORMATS, FFMPEG_AVAILABLE
+from app.utils.config import Config
+
+SAMPLE_TEXT = (
+    "Thanks for walking me through that project. Let's move on to the next question. "
+    "Imagine your API suddenly receives ten times its usual traffic. "
+    "How would you find the bottleneck, and what would you change first?"
+)
+
+# (format, bitrate) pairs to compare. A bitrate of None means the native OpenAI output.
+TTS_VARIANTS = [
+    ("mp3", None),
+    ("opus", None),
+    ("aac", None),
+    ("opus", "32k"),
+    ("opus", "24k"),
+    ("opus", "16k"),
+    ("mp3", "32k"),
+]
+
+# Link speeds in kbit/s used to estimate per-turn transfer time.
+LINK_SPEEDS_KBPS = [256, 1000, 5000]
+
+
+def write_sample_recording(path: str, seconds_silence: float = 1.5, seconds_speech: float = 4.0):
+    """
+    It writes a stereo 48kHz WAV with leading/trailing silence around a voice-like tone,
+    standing in for a browser recording when no real file is given.
+    """
+    rate = 48000
+    frames = bytearray()
+    total = int(rate * (2 * seconds_silence + seconds_speech))
+    for i in range(total):
+        t = i / rate
+        value = 0
+        if seconds_silence <= t < seconds_silence + seconds_speech:
+            envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 3 * t)
+            value = int(8000 * envelope * (math.sin(2 * math.pi * 180 * t) + 0.4 * math.sin(2 * math.pi * 720 * t)))
+        sample = value.to_bytes(2, "little", signed=True)
+        frames += sample + sample
+
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(bytes(frames))
+
+
+def b64_size(data: bytes) -> int:
+    return len(base64.b64encode(data))
+
+
+def transfer_ms(num_bytes: int, kbps: int) -> float:
+    return num_bytes * 8 / kbps
+
+
+def print_row(label: str, size: int, extra: str = ""):
+    times = " | ".join(f"{transfer_ms(size, kbps):8.0f} ms" for kbps in LINK_SPEEDS_KBPS)
+    print(f"{label:<22} {size / 1024:9.1f} KB | {times} {extra}")
+
+
+async def run_benchmark(recording_path: str | None):
+    header_speeds = " | ".join(f"{kbps:>5} kbps" for kbps in LINK_SPEEDS_KBPS)
+
+    print("=" * 80)
+    print("Inbound (recording -> Whisper)")
+    print("=" * 80)
+
+    temp_path = None
+    if recording_path is None:
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        temp.close()
+        temp_path = recording_path = temp.name
+
+    previous_preprocess = Config.STT_PREPROCESS
+    try:
+        if temp_path:
+            write_sample_recording(temp_path)
+            print("No recording given, using a synthetic 7s stereo 48kHz WAV.")
+
+        with open(recording_path, "rb") as f:
+            raw_audio = f.read()
+
+        print(f"{'Payload':<22} {'Size':>12} | {header_speeds}")
+        print_row("raw upload", len(raw_audio))
+        print_row("raw upload (base64)", b64_size(raw_audio))
+
+        if not FFMPEG_AVAILABLE:
+            print("ffmpeg not found: the Whisper payload below is the unprocessed recording.")
+
+        Config.STT_PREPROCESS = True
+        started = time.perf_counter()
+        prepared = await prepare_stt_audio(recording_path)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if prepared is None:
+            print("Preprocessed: gated as silence/noise.")
+        else:
+            print_row("to Whisper", len(prepared[1]), f"(preprocess {elapsed:.0f} ms)")
+    finally:
+        Config.STT_PREPROCESS = previous_preprocess
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    print()
+    print("=" * 80)
+    print("Outbound (TTS -> browser, base64 in JSON)")
+    print("=" * 80)
+    print(f"{'Variant':<22} {'Size':>12} | {header_speeds}")
+
+    for audio_format, bitrate in TTS_VARIANTS:
+        label = f"{audio_format} @ {bitrate or 'native'}"
+        if bitrate and not FFMPEG_AVAILABLE:
+            print(f"{label:<22} skipped: ffmpeg not found")
+            continue
+
+        started = time.perf_counter()
+        try:
+            audio = await synthesize_speech(
+                SAMPLE_TEXT, audio_format=audio_format, bitrate=bitrate, reencode=bitrate is not None
+            )
+        except Exception as e:
+            print(f"{label:<22} failed: {e}")
+            continue
+        elapsed = (time.perf_counter() - started) * 1000
+        mime = TTS_FORMATS[audio_format][0]
+        print_row(label, b64_size(audio), f"(tts {elapsed:.0f} ms, {mime})")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,8 @@
+import os
+
+# Config.validate() and the OpenAI client run at import time. The tests never call Google or OpenAI,
+# so point them at this file and placeholder values when no real credentials are configured.
+if not os.path.exists(os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "google_credentials.json")):
+    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.path.abspath(__file__)
+os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "test-project")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
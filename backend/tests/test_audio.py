@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services import audio
+from app.utils.config import Config
+
+
+@pytest.fixture
+def speech_create(monkeypatch):
+    create = AsyncMock(return_value=SimpleNamespace(content=b"tts-bytes"))
+    monkeypatch.setattr(audio.client.audio.speech, "create", create)
+    return create
+
+
+@pytest.fixture
+def run_ffmpeg(monkeypatch):
+    mock = AsyncMock(return_value=b"encoded")
+    monkeypatch.setattr(audio, "_run_ffmpeg", mock)
+    return mock
+
+
+@pytest.fixture
+def recording(tmp_path):
+    def write(size: int) -> str:
+        path = tmp_path / "recording.webm"
+        path.write_bytes(b"\x01" * size)
+        return str(path)
+    return write
+
+
+def test_prepare_stt_audio_gates_short_speech(monkeypatch, run_ffmpeg, recording):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", True)
+    monkeypatch.setattr(Config, "STT_PREPROCESS", True)
+    too_short = int(2 * Config.STT_SAMPLE_RATE * Config.STT_MIN_SPEECH_SECONDS) - 2
+    run_ffmpeg.return_value = b"\x00" * too_short
+
+    assert asyncio.run(audio.prepare_stt_audio(recording(50000))) is None
+    assert run_ffmpeg.await_count == 1
+
+
+def test_prepare_stt_audio_encodes_speech(monkeypatch, run_ffmpeg, recording):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", True)
+    monkeypatch.setattr(Config, "STT_PREPROCESS", True)
+    run_ffmpeg.side_effect = [b"\x00" * (2 * Config.STT_SAMPLE_RATE), b"opus-bytes"]
+
+    assert asyncio.run(audio.prepare_stt_audio(recording(50000))) == ("speech.ogg", b"opus-bytes")
+
+
+def test_prepare_stt_audio_falls_back_to_byte_gate_on_ffmpeg_error(monkeypatch, run_ffmpeg, recording):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", True)
+    monkeypatch.setattr(Config, "STT_PREPROCESS", True)
+    run_ffmpeg.side_effect = RuntimeError("boom")
+
+    assert asyncio.run(audio.prepare_stt_audio(recording(Config.STT_MIN_RAW_BYTES - 1))) is None
+
+    path = recording(Config.STT_MIN_RAW_BYTES + 1)
+    name, data = asyncio.run(audio.prepare_stt_audio(path))
+    assert name == "recording.webm"
+    assert len(data) == Config.STT_MIN_RAW_BYTES + 1
+
+
+def test_prepare_stt_audio_without_ffmpeg_skips_preprocessing(monkeypatch, run_ffmpeg, recording):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", False)
+    monkeypatch.setattr(Config, "STT_PREPROCESS", True)
+
+    assert asyncio.run(audio.prepare_stt_audio(recording(Config.STT_MIN_RAW_BYTES + 1))) is not None
+    run_ffmpeg.assert_not_awaited()
+
+
+def test_synthesize_speech_without_ffmpeg_makes_one_native_request(monkeypatch, run_ffmpeg, speech_create):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", False)
+
+    result = asyncio.run(audio.synthesize_speech("Hello", audio_format="opus", bitrate="24k"))
+
+    assert result == b"tts-bytes"
+    assert speech_create.await_count == 1
+    assert speech_create.await_args.kwargs["response_format"] == "opus"
+    run_ffmpeg.assert_not_awaited()
+
+
+def test_synthesize_speech_reencodes_pcm(monkeypatch, run_ffmpeg, speech_create):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", True)
+
+    result = asyncio.run(audio.synthesize_speech("Hello", audio_format="opus", bitrate="24k"))
+
+    assert result == b"encoded"
+    assert speech_create.await_args.kwargs["response_format"] == "pcm"
+    args = run_ffmpeg.await_args.args[0]
+    assert args[args.index("-b:a") + 1] == "24k"
+    assert args[args.index("-c:a") + 1] == "libopus"
+
+
+def test_synthesize_speech_failed_reencode_makes_no_second_request(monkeypatch, run_ffmpeg, speech_create):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", True)
+    run_ffmpeg.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(audio.synthesize_speech("Hello", audio_format="opus", bitrate="24k"))
+    assert speech_create.await_count == 1
+
+
+def test_synthesize_speech_reencode_false_ignores_configured_bitrate(monkeypatch, run_ffmpeg, speech_create):
+    monkeypatch.setattr(audio, "FFMPEG_AVAILABLE", True)
+    monkeypatch.setattr(Config, "TTS_BITRATE", "24k")
+
+    asyncio.run(audio.synthesize_speech("Hello", audio_format="mp3", reencode=False))
+
+    assert speech_create.await_args.kwargs["response_format"] == "mp3"
+    run_ffmpeg.assert_not_awaited()
+
+
+def test_synthesize_speech_rejects_unknown_format(speech_create):
+    with pytest.raises(ValueError):
+        asyncio.run(audio.synthesize_speech("Hello", audio_format="wav"))
+    speech_create.assert_not_awaited()
+
+
+def test_config_validate_rejects_unknown_tts_format(monkeypatch):
+    monkeypatch.setattr(Config, "TTS_FORMAT", "ogg")
+    with pytest.raises(ValueError):
+        Config.validate()
+
+
+def test_tts_mime_type():
+    assert audio.tts_mime_type("mp3") == "audio/mpeg"
+    assert audio.tts_mime_type("opus") == "audio/ogg"
+    assert audio.tts_mime_type("aac") == "audio/aac"
+    assert set(audio.TTS_FORMATS) == set(Config.TTS_SUPPORTED_FORMATS)
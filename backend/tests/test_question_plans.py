@@ -0,0 +1,182 @@
+import json
+
+import pytest
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.schemas.question_plan import QuestionPlan
+from app.services import question_plans
+from app.services.question_plans import (
+    QuestionPlanCache,
+    get_questions_plan,
+    make_key,
+    normalize_role,
+    normalize_text,
+    roles_match,
+    session_seed,
+)
+
+CONTEXT = "Software / SaaS"
+
+PLAN = QuestionPlan(
+    domain_questions=[f"Domain question {i}?" for i in range(6)],
+    behavioral_questions=[f"Behavioral question {i}?" for i in range(3)],
+)
+
+
+def test_normalize_text_synonyms():
+    assert normalize_text("backend engineer") == normalize_text("Back-End Developer")
+    assert normalize_text("Full-stack dev") == "fullstack developer"
+    assert normalize_text("Machine Learning Engineer") == normalize_text("ML Engineer")
+
+
+def test_normalize_role_drops_seniority():
+    for role in ["Senior Backend Developer", "Sr. Backend Engineer", "Lead Backend Developer", "Principal back end dev"]:
+        assert make_key(role, CONTEXT) == make_key("Backend Developer", CONTEXT)
+    assert normalize_role("Junior Frontend Dev") == "frontend developer"
+
+
+def test_normalize_role_never_reduces_to_generic_word():
+    assert normalize_role("Tech Lead") == "tech lead"
+    assert normalize_role("Staff Engineer") == "staff developer"
+    assert normalize_role("Senior Manager") == "senior manager"
+    assert normalize_role("Lead") == "lead"
+    assert normalize_role("Senior Software Engineer") == "software developer"
+
+
+def test_tech_synonym_only_applies_to_context():
+    assert make_key("Tech Lead", "General Tech") == "tech lead|general technology"
+
+
+def test_roles_match():
+    assert roles_match(normalize_role("Backend Developers"), normalize_role("Backend Developer"))
+    assert roles_match(normalize_role("Backnd Engineer"), normalize_role("Backend Developer"))
+    assert not roles_match(normalize_role("Frontend Developer"), normalize_role("Backend Developer"))
+    assert not roles_match(normalize_role("AI Engineer"), normalize_role("ML Engineer"))
+    assert not roles_match(normalize_role("QA Engineer"), normalize_role("ML Engineer"))
+
+
+def test_session_seed_uses_first_candidate_answer():
+    messages = [
+        AIMessage(content="Please introduce yourself."),
+        HumanMessage(content=[{"type": "text", "text": "I am a backend developer."}]),
+        AIMessage(content="Next question."),
+        HumanMessage(content="Another answer."),
+    ]
+    assert session_seed(messages) == "I am a backend developer."
+    assert session_seed([AIMessage(content="Hello")]) == ""
+
+
+def test_lookup_resolves_variants_to_base_plan(tmp_path):
+    cache = QuestionPlanCache(str(tmp_path / "plans.json"), ttl_hours=1)
+    cache.store("Backend Developer", CONTEXT, PLAN)
+
+    for role in ["Senior Backend Developer", "Sr. Backend Engineer", "backend engineers"]:
+        key, plan = cache.lookup(role, CONTEXT)
+        assert key == make_key("Backend Developer", CONTEXT)
+        assert plan == PLAN
+
+    assert cache.lookup("Frontend Developer", CONTEXT) is None
+    assert cache.lookup("Backend Developer", "Fintech / Banking") is None
+
+
+def test_lookup_respects_ttl(tmp_path):
+    cache = QuestionPlanCache(str(tmp_path / "plans.json"), ttl_hours=1)
+    cache.store("Backend Developer", CONTEXT, PLAN)
+    cache.entries[make_key("Backend Developer", CONTEXT)]["created_at"] -= 2 * 3600
+    assert cache.lookup("Backend Developer", CONTEXT) is None
+
+
+def test_lookup_sees_plans_saved_by_another_process(tmp_path):
+    path = str(tmp_path / "plans.json")
+    server = QuestionPlanCache(path, ttl_hours=1)
+    assert server.lookup("Backend Developer", CONTEXT) is None
+
+    warm_up = QuestionPlanCache(path, ttl_hours=1)
+    warm_up.store("Backend Developer", CONTEXT, PLAN)
+    warm_up.save()
+
+    assert server.lookup("Backend Developer", CONTEXT) is not None
+
+
+def test_failed_load_is_retried(tmp_path):
+    path = tmp_path / "plans.json"
+    path.write_text("{ half-written")
+    cache = QuestionPlanCache(str(path), ttl_hours=1)
+    assert cache.lookup("Backend Developer", CONTEXT) is None
+
+    writer = QuestionPlanCache(str(tmp_path / "other.json"), ttl_hours=1)
+    writer.store("Backend Developer", CONTEXT, PLAN)
+    path.write_text(json.dumps(writer.entries))
+
+    assert cache.lookup("Backend Developer", CONTEXT) is not None
+
+
+def test_save_leaves_no_temp_files(tmp_path):
+    cache = QuestionPlanCache(str(tmp_path / "plans.json"), ttl_hours=1)
+    cache.store("Backend Developer", CONTEXT, PLAN)
+    cache.save()
+    assert [p.name for p in tmp_path.iterdir()] == ["plans.json"]
+
+
+def test_get_questions_plan_rotation(tmp_path, monkeypatch):
+    cache = QuestionPlanCache(str(tmp_path / "plans.json"), ttl_hours=1)
+    cache.store("Backend Developer", CONTEXT, PLAN)
+    monkeypatch.setattr(question_plans, "question_plan_cache", cache)
+
+    first = get_questions_plan("Backend Developer", CONTEXT, "seed-a")
+    assert first == get_questions_plan("Backend Developer", CONTEXT, "seed-a")
+
+    rendered = {get_questions_plan("Backend Developer", CONTEXT, f"seed-{i}") for i in range(10)}
+    assert len(rendered) > 1
+
+    assert get_questions_plan("Product Manager", CONTEXT, "seed-a") is None
+
+
+def test_fuzzy_lookup_skips_stale_candidates(tmp_path):
+    cache = QuestionPlanCache(str(tmp_path / "plans.json"), ttl_hours=1)
+    cache.store("Backend Developers", CONTEXT, QuestionPlan(domain_questions=["Old?", "Old 2?"], behavioral_questions=["Old?"]))
+    cache.entries[make_key("Backend Developers", CONTEXT)]["created_at"] -= 2 * 3600
+    cache.store("Backend Develper", CONTEXT, PLAN)
+
+    key, plan = cache.lookup("Backend Developer", CONTEXT)
+    assert key == make_key("Backend Develper", CONTEXT)
+    assert plan == PLAN
+
+
+@pytest.mark.parametrize("body", [
+    [],
+    {"backend developer|software saas": ["not", "a", "dict"]},
+    {"backend developer|software saas": {"created_at": 0}},
+])
+def test_wrong_shape_file_falls_back(tmp_path, monkeypatch, body):
+    path = tmp_path / "plans.json"
+    path.write_text(json.dumps(body))
+    cache = QuestionPlanCache(str(path), ttl_hours=1)
+    monkeypatch.setattr(question_plans, "question_plan_cache", cache)
+
+    assert isinstance(cache.entries, dict)
+    assert cache.lookup("Backend Developer", CONTEXT) is None
+    assert get_questions_plan("Backend Developer", CONTEXT, "seed") is None
+    assert cache.needs_refresh("Backend Developer", CONTEXT)
+
+
+def test_malformed_entries_are_skipped(tmp_path, monkeypatch):
+    path = tmp_path / "plans.json"
+    fresh = QuestionPlanCache(str(tmp_path / "other.json"), ttl_hours=1)
+    fresh.store("Backend Developers", CONTEXT, PLAN)
+    good_entry = fresh.entries[make_key("Backend Developers", CONTEXT)]
+
+    path.write_text(json.dumps({
+        "no separator": good_entry,
+        make_key("Backend Developer", CONTEXT): {"created_at": good_entry["created_at"], "plan": {"domain_questions": ["Q?"]}},
+        make_key("Backend Develper", CONTEXT): {"created_at": "yesterday", "plan": good_entry["plan"]},
+        make_key("Backend Developers", CONTEXT): good_entry,
+    }))
+    cache = QuestionPlanCache(str(path), ttl_hours=1)
+    monkeypatch.setattr(question_plans, "question_plan_cache", cache)
+
+    key, plan = cache.lookup("Backend Developer", CONTEXT)
+    assert key == make_key("Backend Developers", CONTEXT)
+    assert plan == PLAN
+    assert get_questions_plan("Product Manager", CONTEXT, "seed") is None
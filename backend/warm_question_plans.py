@@ -0,0 +1,57 @@
+import sys
+
+from app.core.graph import llm
+from app.services.question_plans import question_plan_cache, generate_question_plan, make_key
+
+COMMON_ROLES = [
+    "Backend Developer",
+    "Frontend Developer",
+    "Full Stack Developer",
+    "AI Engineer",
+    "Machine Learning Engineer",
+    "Data Scientist",
+    "Data Engineer",
+    "DevOps Engineer",
+    "Mobile Developer",
+    "QA Engineer",
+    "Product Manager",
+    "UX Designer",
+]
+
+COMMON_CONTEXTS = [
+    "Software / SaaS",
+    "Fintech / Banking",
+    "E-commerce / Retail",
+    "Data / AI & Analytics",
+    "Healthcare / MedTech",
+    "Gaming / GameDev",
+]
+
+
+def warm_question_plans(force: bool = False):
+    print("---Question Plan Warm-Up Begins---")
+    generated = 0
+
+    for role in COMMON_ROLES:
+        for context in COMMON_CONTEXTS:
+            key = make_key(role, context)
+            if not force and not question_plan_cache.needs_refresh(role, context):
+                print(f"Fresh: {key}")
+                continue
+
+            try:
+                plan = generate_question_plan(llm, role, context)
+            except Exception as e:
+                print(f"Failed: {key} ({e})")
+                continue
+
+            question_plan_cache.store(role, context, plan)
+            question_plan_cache.save()
+            generated += 1
+            print(f"Generated: {key} ({len(plan.domain_questions)} domain, {len(plan.behavioral_questions)} behavioral)")
+
+    print(f"Done. {generated} plan(s) generated, saved to {question_plan_cache.path}")
+
+
+if __name__ == "__main__":
+    warm_question_plans(force="--force" in sys.argv)
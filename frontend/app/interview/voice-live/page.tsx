@@ -62,7 +62,7 @@ function LiveInterviewContent() {
              if (data.audio && audioPlayerRef.current) {
                 isAiTalkingRef.current = true;
                 setIsAiTalking(true);
-                audioPlayerRef.current.src = `data:audio/mp3;base64,${data.audio}`;
+                audioPlayerRef.current.src = `data:${data.audio_mime || "audio/mpeg"};base64,${data.audio}`;
                 audioPlayerRef.current.play();
                 audioPlayerRef.current.onended = showFeedback;
              } else {
@@ -75,7 +75,7 @@ function LiveInterviewContent() {
             isAiTalkingRef.current = true;
             setIsAiTalking(true);
             
-            audioPlayerRef.current.src = `data:audio/mp3;base64,${data.audio}`;
+            audioPlayerRef.current.src = `data:${data.audio_mime || "audio/mpeg"};base64,${data.audio}`;
             audioPlayerRef.current.play();
             
             audioPlayerRef.current.onended = () => {
@@ -63,7 +63,7 @@ function VoicePTTContent() {
             setStep(res.data.interview_step);
 
             if (res.data.response_audio) {
-              playAudio(res.data.response_audio);
+              playAudio(res.data.response_audio, res.data.response_audio_mime);
           }
         } catch (error) {
             console.error("Init Error", error);
@@ -130,7 +130,7 @@ function VoicePTTContent() {
       setStep(data.interview_step);
 
       if (data.is_finished && data.feedback) setFeedback(data.feedback);
-      if (data.response_audio) playAudio(data.response_audio);
+      if (data.response_audio) playAudio(data.response_audio, data.response_audio_mime);
 
     } catch (error) {
       console.error("Audio Upload Error:", error);
@@ -140,9 +140,9 @@ function VoicePTTContent() {
     }
   };
 
-  const playAudio = (base64Audio: string) => {
+  const playAudio = (base64Audio: string, mimeType?: string | null) => {
     try {
-      const audioSrc = `data:audio/mp3;base64,${base64Audio}`;
+      const audioSrc = `data:${mimeType || "audio/mpeg"};base64,${base64Audio}`;
       const audio = new Audio(audioSrc);
       setIsPlaying(true);
       audio.play();